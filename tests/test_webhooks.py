@@ -132,6 +132,20 @@ class TestWebhookEventHandling:
         assert payload.timestamp == 1633456789
         assert payload.session_id == "session-id-123"
 
+    def test_parses_null_timestamps_as_zero_sentinel(self):
+        # Wire payloads spell "not set" either as a missing key or an explicit null;
+        # both land on the 0 sentinel.
+        payload = {
+            "event": WebhookEventType.CHATS_UPSERT.value,
+            "timestamp": None,
+            "data": [{"id": "1234567890", "conversationTimestamp": None}]
+        }
+        adapter = TypeAdapter(WasenderWebhookEvent)
+        payload = adapter.validate_python(payload)
+        assert payload.timestamp == 0
+        assert payload.data[0].conversation_timestamp == 0
+        assert payload.data[0].mute_end_time == 0
+
     def test_parses_chats_update_event_correctly_model(self):
         chat_update_data = {
             "id": "1234567890", "unreadCount": 0, "conversationTimestamp": 1633456789
@@ -223,6 +237,8 @@ class TestWebhookEventHandling:
         payload = adapter.validate_python(payload)
         assert payload.event == WebhookEventType.GROUP_PARTICIPANTS_UPDATE
         assert payload.data.action == participants_update_data["action"]
+        # Bare JID strings are coerced into GroupParticipant objects.
+        assert payload.data.participants[0].id == "1234567890"
 
     def test_parses_contacts_upsert_event_correctly_model(self):
         contact_data = {
@@ -274,6 +290,33 @@ class TestWebhookEventHandling:
         assert payload.event == WebhookEventType.MESSAGES_UPSERT
         assert payload.data.key.id == message_key_data["id"]
 
+    def test_parses_messages_upsert_media_message_correctly_model(self):
+        message_key_data = {"remoteJid": "remote@s.whatsapp.net", "id": "IMG1", "fromMe": False}
+        image_message_data = {
+            "url": "https://mmg.whatsapp.net/d/f/some-image.enc",
+            "mimetype": "image/jpeg", "caption": "A caption",
+            "fileLength": 12345, "height": 600, "width": 800
+        }
+        messages_upsert_data = {
+            "key": message_key_data,
+            "message": {"imageMessage": image_message_data},
+            "messageTimestamp": 1633456789
+        }
+        payload = {
+            "event": WebhookEventType.MESSAGES_UPSERT.value,
+            "timestamp": 1633456789,
+            "data": messages_upsert_data
+        }
+        adapter = TypeAdapter(WasenderWebhookEvent)
+        payload = adapter.validate_python(payload)
+        assert payload.event == WebhookEventType.MESSAGES_UPSERT
+        image = payload.data.message.image_message
+        assert isinstance(image, webhook_models.ImageMessage)
+        assert image.url == image_message_data["url"]
+        assert image.mimetype == image_message_data["mimetype"]
+        assert image.caption == image_message_data["caption"]
+        assert image.file_length == image_message_data["fileLength"]
+
     def test_parses_messages_update_event_correctly_model(self):
         message_key_data = {"remoteJid": "remote@s.whatsapp.net", "id": "ABC", "fromMe": True}
         message_update_data = {"status": "read"}
@@ -373,6 +416,48 @@ class TestWebhookEventHandling:
         assert payload.data.qr == qr_code_updated_data["qr"]
         assert payload.data.session_id == qr_code_updated_data["sessionId"]
 
+class TestPeekEventType:
+    def test_reads_event_from_raw_bytes(self):
+        raw = json.dumps({"event": "chats.upsert", "data": []}).encode('utf-8')
+        assert webhook_models.peek_event_type(raw) == "chats.upsert"
+
+    def test_reads_event_from_str(self):
+        assert webhook_models.peek_event_type('{"event": "session.status"}') == "session.status"
+
+    def test_raises_key_error_without_event(self):
+        with pytest.raises(KeyError):
+            webhook_models.peek_event_type(b'{"data": []}')
+
+class TestWebhookModelImmutability:
+    # MessageKey / Receipt / Reaction / ChatEntry are instantiated O(messages) times
+    # per batch webhook; they are frozen so parsed events can be shared between
+    # handlers (and used as dict/set keys) without defensive copies.
+    def test_message_key_is_frozen(self):
+        key = webhook_models.MessageKey(id="MSG1", fromMe=False, remoteJid="r@s.whatsapp.net")
+        with pytest.raises(Exception):
+            key.id = "MSG2"
+
+    def test_message_key_is_hashable_and_comparable(self):
+        key_a = webhook_models.MessageKey(id="MSG1", fromMe=False, remoteJid="r@s.whatsapp.net")
+        key_b = webhook_models.MessageKey(id="MSG1", fromMe=False, remoteJid="r@s.whatsapp.net")
+        assert key_a == key_b
+        assert hash(key_a) == hash(key_b)
+        assert len({key_a, key_b}) == 1
+
+    def test_chat_entry_is_frozen(self):
+        entry = webhook_models.ChatEntry(id="123", name="Chat")
+        with pytest.raises(Exception):
+            entry.name = "Renamed"
+
+    def test_receipt_and_reaction_are_frozen(self):
+        receipt = webhook_models.Receipt(userJid="u@w.net", status="read")
+        with pytest.raises(Exception):
+            receipt.status = "played"
+        key = webhook_models.MessageKey(id="MSG1", fromMe=True, remoteJid="r@s.whatsapp.net")
+        reaction = webhook_models.Reaction(text="👍", key=key)
+        with pytest.raises(Exception):
+            reaction.text = "👎"
+
 # Client specific fixtures and tests - REMOVED
 # @pytest.fixture
 # def mock_client(): ...
@@ -15,7 +15,8 @@ from .errors import WasenderAPIError
 from .webhook import (
     WEBHOOK_SIGNATURE_HEADER,
     verify_wasender_webhook_signature,
-    WasenderWebhookEvent
+    WasenderWebhookEvent,
+    parse_webhook_json
 )
 from .contacts import (
     GetAllContactsResult,
@@ -46,7 +47,7 @@ from .sessions import (
     RegenerateApiKeyResult,
     GetSessionStatusResult
 )
-from pydantic import TypeAdapter
+from pydantic import ValidationError
 
 class WebhookRequestAdapter:
     def __init__(self, headers: Dict[str, str], body: str):
@@ -70,11 +71,15 @@ class WasenderSyncClient:
     ):
         if not api_key:
             raise ValueError("WASENDER_API_KEY is required to initialize the Wasender SDK.")
+        if webhook_secret is not None and not webhook_secret:
+            raise ValueError("webhook_secret, when provided, must be a non-empty string.")
 
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.retry_config = retry_options if retry_options is not None else RetryConfig()
         self.webhook_secret = webhook_secret
+        # Encoded once here so each webhook verification is a bytes-to-bytes compare.
+        self._webhook_secret_bytes = webhook_secret.encode('utf-8') if webhook_secret else None
         self.personal_access_token = personal_access_token
 
     def _parse_rate_limit_headers(self, headers: Dict[str, str]) -> RateLimitInfo:
@@ -428,17 +433,17 @@ class WasenderSyncClient:
         if not self.webhook_secret:
             raise ValueError("Webhook secret is not configured in the client.")
         
-        if not verify_wasender_webhook_signature(signature_header, self.webhook_secret):
+        if not verify_wasender_webhook_signature(signature_header, self._webhook_secret_bytes):
             raise WasenderAPIError("Invalid webhook signature", status_code=400)
 
         try:
-            request_body_str = request_body_bytes.decode('utf-8')
-            data = json.loads(request_body_str)
-            adapter = TypeAdapter(WasenderWebhookEvent)
-            parsed_event = adapter.validate_python(data)
-            return parsed_event
-        except json.JSONDecodeError as e:
-            raise WasenderAPIError("Invalid JSON in webhook body", status_code=400) from e
+            # validate_json parses and validates the raw bytes in one pass, without
+            # materializing an intermediate dict via json.loads.
+            return parse_webhook_json(request_body_bytes)
+        except ValidationError as e:
+            if any(err.get("type") == "json_invalid" for err in e.errors()):
+                raise WasenderAPIError("Invalid JSON in webhook body", status_code=400) from e
+            raise WasenderAPIError(f"Invalid webhook event data: {str(e)}", status_code=400) from e
         except Exception as e:
             raise WasenderAPIError(f"Invalid webhook event data: {str(e)}", status_code=400) from e
 
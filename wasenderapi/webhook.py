@@ -1,27 +1,68 @@
-import json
+import hmac
+import sys
+import warnings
 from enum import Enum
-from typing import Dict, Any, Optional, List, Union, TypeVar, Generic, Literal
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from typing import ClassVar, Dict, Any, Optional, List, Union, TypeVar, Literal, get_args
+try:
+    from typing import Annotated
+except ImportError:  # Python 3.8: Annotated lives in typing_extensions (a pydantic dependency)
+    from typing_extensions import Annotated
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, TypeAdapter, create_model, field_validator
 from .groups import GroupParticipant
 
+# This module is almost entirely pydantic validation at runtime; the official
+# pydantic-core wheels are PGO-optimized and noticeably faster than local debug
+# builds. Flag non-release builds once at import so a slow environment is visible.
+try:
+    from pydantic_core import _pydantic_core as _pydantic_core_ext
+    _PYDANTIC_CORE_BUILD_PROFILE = getattr(_pydantic_core_ext, 'build_profile', 'release')
+    del _pydantic_core_ext
+except ImportError:  # pragma: no cover - pydantic always ships pydantic-core
+    _PYDANTIC_CORE_BUILD_PROFILE = 'release'
+if _PYDANTIC_CORE_BUILD_PROFILE != 'release':
+    warnings.warn(
+        f"pydantic-core was built with the '{_PYDANTIC_CORE_BUILD_PROFILE}' profile; "
+        "webhook parsing will be noticeably slower than with the official "
+        "(PGO-optimized) release wheels.",
+        RuntimeWarning,
+    )
+
 WEBHOOK_SIGNATURE_HEADER = 'x-webhook-signature'
 
 def verify_wasender_webhook_signature(
-    request_signature: Optional[str],
-    configured_secret: str
+    request_signature: Optional[Union[str, bytes]],
+    configured_secret: Union[str, bytes]
 ) -> bool:
     """Verify the webhook signature from Wasender.
-    
+
     IMPORTANT: The current Wasender documentation example shows a direct string comparison
-    for the signature and secret. This is a very simple verification method. Most webhook 
+    for the signature and secret. This is a very simple verification method. Most webhook
     systems use HMAC-SHA256 or similar cryptographic hashes for security.
-    
+
     Please VERIFY with Wasender's official documentation or support if this simple string
     comparison is indeed the correct and only method for signature verification.
+
+    The comparison uses hmac.compare_digest so it runs in constant time and does not
+    leak where the signature first diverges from the secret. Note that compare_digest
+    still leaks whether the two inputs differ in length; that is acceptable since the
+    secret's length is not considered sensitive here.
+
+    The falsy-input guard exists for direct callers; the clients validate their
+    webhook secret at construction time, so on their hot path only the
+    request_signature check can trigger.
+
+    Both arguments may be str or bytes; passing pre-encoded bytes (e.g. a raw header
+    value, or a secret encoded once at client construction) skips the per-call UTF-8
+    encode entirely.
     """
     if not request_signature or not configured_secret:
         return False
-    return request_signature == configured_secret
+    if isinstance(request_signature, str):
+        request_signature = request_signature.encode('utf-8')
+    if isinstance(configured_secret, str):
+        configured_secret = configured_secret.encode('utf-8')
+    return hmac.compare_digest(request_signature, configured_secret)
 
 class WasenderWebhookEventType(str, Enum):
     # Chat Events
@@ -47,25 +88,82 @@ class WasenderWebhookEventType(str, Enum):
     SESSION_STATUS = 'session.status'
     QRCODE_UPDATED = 'qrcode.updated'
 
+# Intern the event values so comparing them against payload strings (dict lookups,
+# discriminator matching, handler dispatch) hits CPython's pointer-equality fast path.
+for _member in WasenderWebhookEventType:
+    _member._value_ = sys.intern(_member._value_)
+del _member
+
+# Shared config for every webhook model: accept field names as well as aliases,
+# drop unknown keys without per-key bookkeeping, keep parsed events immutable, and
+# build schemas at import time rather than on the first webhook.
+_WEBHOOK_MODEL_CONFIG = ConfigDict(
+    populate_by_name=True,
+    extra='ignore',
+    frozen=True,
+    defer_build=False,
+)
+
+def _zero_if_none(value: Any) -> Any:
+    return 0 if value is None else value
+
+# Timestamp-like ints where "not set" arrives either as a missing key or an explicit
+# JSON null; both map to the 0 sentinel while the schema stays a plain int.
+TimestampInt = Annotated[int, BeforeValidator(_zero_if_none)]
+
 EventType = TypeVar('EventType', bound=WasenderWebhookEventType)
 DataType = TypeVar('DataType')
 
-class BaseWebhookEvent(BaseModel, Generic[EventType, DataType]):
-    event: EventType
-    timestamp: Optional[int] = None
-    data: DataType
+@lru_cache(maxsize=None)
+def _specialize_webhook_event(base: type, event_type: Any, data_type: Any) -> type:
+    return create_model(base.__name__, __base__=base, event=(event_type, ...), data=(data_type, ...))
+
+class BaseWebhookEvent(BaseModel):
+    model_config = _WEBHOOK_MODEL_CONFIG
+
+    event: WasenderWebhookEventType
+    # 0 means the timestamp was absent (missing or null); see TimestampInt.
+    timestamp: TimestampInt = 0
+    data: Any
     session_id: Optional[str] = Field(None, alias="sessionId")
 
+    def __class_getitem__(cls, item: Any) -> type:
+        # Kept for backwards compatibility with the old generic form
+        # BaseWebhookEvent[Literal[...], DataType]. Specializations are memoized so
+        # repeated subscriptions return the same subclass instead of rebuilding a
+        # schema through the generic-alias machinery each time.
+        if not isinstance(item, tuple) or len(item) != 2:
+            raise TypeError(
+                f"{cls.__name__}[...] expects an (event type, data type) pair"
+            )
+        return _specialize_webhook_event(cls, item[0], item[1])
+
+    # alias -> field name, precomputed per class so __getitem__ is a dict lookup
+    # instead of a scan over model_fields on every aliased access.
+    _alias_map: ClassVar[Dict[str, str]] = {}
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._alias_map = {f.alias: name for name, f in cls.model_fields.items() if f.alias}
+
     def __getitem__(self, key: str) -> Any:
         try:
             return getattr(self, key)
         except AttributeError:
-            for field_name, field_model in self.model_fields.items():
-                if field_model.alias == key:
-                    return getattr(self, field_name)
-            raise KeyError(key)
+            field_name = self._alias_map.get(key)
+            if field_name is None:
+                raise KeyError(key)
+            return getattr(self, field_name)
+
+# __pydantic_init_subclass__ only runs for subclasses; seed the base class map too.
+BaseWebhookEvent._alias_map = {
+    f.alias: name for name, f in BaseWebhookEvent.model_fields.items() if f.alias
+}
 
 class MessageKey(BaseModel):
+    model_config = _WEBHOOK_MODEL_CONFIG
+
     id: str
     from_me: bool = Field(..., alias="fromMe")
     remote_jid: str = Field(..., alias="remoteJid")
@@ -73,18 +171,22 @@ class MessageKey(BaseModel):
 
 # Chat Event Models
 class ChatEntry(BaseModel):
+    model_config = _WEBHOOK_MODEL_CONFIG
+
     id: str
     name: Optional[str] = None
-    conversation_timestamp: Optional[int] = Field(None, alias="conversationTimestamp")
+    conversation_timestamp: TimestampInt = Field(0, alias="conversationTimestamp")
     unread_count: Optional[int] = Field(None, alias="unreadCount")
-    mute_end_time: Optional[int] = Field(None, alias="muteEndTime")
+    mute_end_time: TimestampInt = Field(0, alias="muteEndTime")
     is_spam: Optional[bool] = Field(None, alias="isSpam")
 
 # Group Event Models
 class GroupMetadata(BaseModel):
+    model_config = _WEBHOOK_MODEL_CONFIG
+
     jid: str
     subject: str
-    creation: Optional[int] = None
+    creation: TimestampInt = 0
     owner: Optional[str] = None
     desc: Optional[str] = None
     participants: Optional[List[GroupParticipant]] = None
@@ -92,12 +194,26 @@ class GroupMetadata(BaseModel):
     restrict: Optional[bool] = None
 
 class GroupParticipantsUpdateData(BaseModel):
+    model_config = _WEBHOOK_MODEL_CONFIG
+
     jid: str
-    participants: List[Union[str, GroupParticipant]]
+    participants: List[GroupParticipant]
     action: Literal['add', 'remove', 'promote', 'demote']
 
+    @field_validator('participants', mode='before')
+    @classmethod
+    def _coerce_participants(cls, value: Any) -> Any:
+        # The wire format sends either bare JID strings or participant objects.
+        # Normalize strings here so pydantic-core runs only the GroupParticipant
+        # validator per element instead of probing a two-arm union for each one.
+        if isinstance(value, list):
+            return [{'id': p} if isinstance(p, str) else p for p in value]
+        return value
+
 # Contact Event Models
 class ContactEntry(BaseModel):
+    model_config = _WEBHOOK_MODEL_CONFIG
+
     jid: str
     name: Optional[str] = None
     notify: Optional[str] = None
@@ -106,112 +222,329 @@ class ContactEntry(BaseModel):
     img_url: Optional[str] = Field(None, alias="imgUrl")
 
 # Message Event Models
+class ImageMessage(BaseModel):
+    model_config = _WEBHOOK_MODEL_CONFIG
+
+    url: Optional[str] = None
+    mimetype: Optional[str] = None
+    caption: Optional[str] = None
+    file_length: Optional[int] = Field(None, alias="fileLength")
+    height: Optional[int] = None
+    width: Optional[int] = None
+    jpeg_thumbnail: Optional[str] = Field(None, alias="jpegThumbnail")
+
+class VideoMessage(BaseModel):
+    model_config = _WEBHOOK_MODEL_CONFIG
+
+    url: Optional[str] = None
+    mimetype: Optional[str] = None
+    caption: Optional[str] = None
+    file_length: Optional[int] = Field(None, alias="fileLength")
+    seconds: Optional[int] = None
+    height: Optional[int] = None
+    width: Optional[int] = None
+    jpeg_thumbnail: Optional[str] = Field(None, alias="jpegThumbnail")
+
+class DocumentMessage(BaseModel):
+    model_config = _WEBHOOK_MODEL_CONFIG
+
+    url: Optional[str] = None
+    mimetype: Optional[str] = None
+    title: Optional[str] = None
+    file_name: Optional[str] = Field(None, alias="fileName")
+    file_length: Optional[int] = Field(None, alias="fileLength")
+    page_count: Optional[int] = Field(None, alias="pageCount")
+    caption: Optional[str] = None
+
+class AudioMessage(BaseModel):
+    model_config = _WEBHOOK_MODEL_CONFIG
+
+    url: Optional[str] = None
+    mimetype: Optional[str] = None
+    seconds: Optional[int] = None
+    ptt: Optional[bool] = None
+    file_length: Optional[int] = Field(None, alias="fileLength")
+
+class StickerMessage(BaseModel):
+    model_config = _WEBHOOK_MODEL_CONFIG
+
+    url: Optional[str] = None
+    mimetype: Optional[str] = None
+    file_length: Optional[int] = Field(None, alias="fileLength")
+    is_animated: Optional[bool] = Field(None, alias="isAnimated")
+    height: Optional[int] = None
+    width: Optional[int] = None
+
+class ContactMessage(BaseModel):
+    model_config = _WEBHOOK_MODEL_CONFIG
+
+    display_name: Optional[str] = Field(None, alias="displayName")
+    vcard: Optional[str] = None
+
+class LocationMessage(BaseModel):
+    model_config = _WEBHOOK_MODEL_CONFIG
+
+    degrees_latitude: Optional[float] = Field(None, alias="degreesLatitude")
+    degrees_longitude: Optional[float] = Field(None, alias="degreesLongitude")
+    name: Optional[str] = None
+    address: Optional[str] = None
+    url: Optional[str] = None
+
 class MessageContent(BaseModel):
+    model_config = _WEBHOOK_MODEL_CONFIG
+
     conversation: Optional[str] = None
-    image_message: Optional[Dict[str, Any]] = Field(None, alias="imageMessage")
-    video_message: Optional[Dict[str, Any]] = Field(None, alias="videoMessage")
-    document_message: Optional[Dict[str, Any]] = Field(None, alias="documentMessage")
-    audio_message: Optional[Dict[str, Any]] = Field(None, alias="audioMessage")
-    sticker_message: Optional[Dict[str, Any]] = Field(None, alias="stickerMessage")
-    contact_message: Optional[Dict[str, Any]] = Field(None, alias="contactMessage")
-    location_message: Optional[Dict[str, Any]] = Field(None, alias="locationMessage")
+    image_message: Optional[ImageMessage] = Field(None, alias="imageMessage")
+    video_message: Optional[VideoMessage] = Field(None, alias="videoMessage")
+    document_message: Optional[DocumentMessage] = Field(None, alias="documentMessage")
+    audio_message: Optional[AudioMessage] = Field(None, alias="audioMessage")
+    sticker_message: Optional[StickerMessage] = Field(None, alias="stickerMessage")
+    contact_message: Optional[ContactMessage] = Field(None, alias="contactMessage")
+    location_message: Optional[LocationMessage] = Field(None, alias="locationMessage")
 
 class MessagesUpsertData(BaseModel):
+    model_config = _WEBHOOK_MODEL_CONFIG
+
     key: MessageKey
     message: Optional[MessageContent] = None
     push_name: Optional[str] = Field(None, alias="pushName")
-    message_timestamp: Optional[int] = Field(None, alias="messageTimestamp")
+    message_timestamp: TimestampInt = Field(0, alias="messageTimestamp")
 
 class MessageUpdate(BaseModel):
+    model_config = _WEBHOOK_MODEL_CONFIG
+
     status: str
 
 class MessagesUpdateDataEntry(BaseModel):
+    model_config = _WEBHOOK_MODEL_CONFIG
+
     key: MessageKey
     update: MessageUpdate
 
 class MessagesDeleteData(BaseModel):
+    model_config = _WEBHOOK_MODEL_CONFIG
+
     keys: List[MessageKey]
 
 class Reaction(BaseModel):
+    model_config = _WEBHOOK_MODEL_CONFIG
+
     text: str
     key: MessageKey
     sender_timestamp_ms: Optional[str] = Field(None, alias="senderTimestampMs")
     read: Optional[bool] = None
 
 class MessagesReactionDataEntry(BaseModel):
+    model_config = _WEBHOOK_MODEL_CONFIG
+
     key: MessageKey
     reaction: Reaction
 
 # Message Receipt Models
 class Receipt(BaseModel):
+    model_config = _WEBHOOK_MODEL_CONFIG
+
     user_jid: str = Field(..., alias="userJid")
     status: str
-    t: Optional[int] = None
+    t: TimestampInt = 0
 
 class MessageReceiptUpdateDataEntry(BaseModel):
+    model_config = _WEBHOOK_MODEL_CONFIG
+
     key: MessageKey
     receipt: Receipt
 
+# Interned copies of the literal value sets used below. Handlers branching on these
+# fields (`if status == "CONNECTED": ...`, `if action in GROUP_PARTICIPANTS_ACTIONS`)
+# get pointer-equality fast paths and O(1) membership checks against the same
+# interned strings pydantic validated.
+SESSION_STATUS_VALUES = frozenset(
+    sys.intern(s) for s in (
+        "CONNECTED", "DISCONNECTED", "NEED_SCAN", "CONNECTING", "LOGGED_OUT", "EXPIRED"
+    )
+)
+GROUP_PARTICIPANTS_ACTIONS = frozenset(
+    sys.intern(s) for s in ('add', 'remove', 'promote', 'demote')
+)
+
 # Session Event Models
 class MessageSentData(BaseModel):
+    model_config = _WEBHOOK_MODEL_CONFIG
+
     key: MessageKey
     message: Optional[MessageContent] = None
     status: Optional[str] = None
 
 class SessionStatusData(BaseModel):
+    model_config = _WEBHOOK_MODEL_CONFIG
+
     status: Literal["CONNECTED", "DISCONNECTED", "NEED_SCAN", "CONNECTING", "LOGGED_OUT", "EXPIRED"]
     session_id: Optional[str] = Field(None, alias="sessionId")
     reason: Optional[str] = None
 
 class QrCodeUpdatedData(BaseModel):
+    model_config = _WEBHOOK_MODEL_CONFIG
+
     qr: str
     session_id: Optional[str] = Field(None, alias="sessionId")
 
-# Define specific event types using the generic BaseWebhookEvent
-ChatsUpsertEvent = BaseWebhookEvent[Literal[WasenderWebhookEventType.CHATS_UPSERT], List[ChatEntry]]
-ChatsUpdateEvent = BaseWebhookEvent[Literal[WasenderWebhookEventType.CHATS_UPDATE], List[ChatEntry]]
-ChatsDeleteEvent = BaseWebhookEvent[Literal[WasenderWebhookEventType.CHATS_DELETE], List[str]]
-
-GroupsUpsertEvent = BaseWebhookEvent[Literal[WasenderWebhookEventType.GROUPS_UPSERT], List[GroupMetadata]]
-GroupsUpdateEvent = BaseWebhookEvent[Literal[WasenderWebhookEventType.GROUPS_UPDATE], List[GroupMetadata]]
-GroupParticipantsUpdateEvent = BaseWebhookEvent[Literal[WasenderWebhookEventType.GROUP_PARTICIPANTS_UPDATE], GroupParticipantsUpdateData]
-
-ContactsUpsertEvent = BaseWebhookEvent[Literal[WasenderWebhookEventType.CONTACTS_UPSERT], List[ContactEntry]]
-ContactsUpdateEvent = BaseWebhookEvent[Literal[WasenderWebhookEventType.CONTACTS_UPDATE], List[ContactEntry]]
-
-MessagesUpsertEvent = BaseWebhookEvent[Literal[WasenderWebhookEventType.MESSAGES_UPSERT], MessagesUpsertData]
-MessagesUpdateEvent = BaseWebhookEvent[Literal[WasenderWebhookEventType.MESSAGES_UPDATE], List[MessagesUpdateDataEntry]]
-MessagesDeleteEvent = BaseWebhookEvent[Literal[WasenderWebhookEventType.MESSAGES_DELETE], MessagesDeleteData]
-MessagesReactionEvent = BaseWebhookEvent[Literal[WasenderWebhookEventType.MESSAGES_REACTION], List[MessagesReactionDataEntry]]
-
-MessageReceiptUpdateEvent = BaseWebhookEvent[Literal[WasenderWebhookEventType.MESSAGE_RECEIPT_UPDATE], List[MessageReceiptUpdateDataEntry]]
-MessageSentEvent = BaseWebhookEvent[Literal[WasenderWebhookEventType.MESSAGE_SENT], MessageSentData]
-SessionStatusEvent = BaseWebhookEvent[Literal[WasenderWebhookEventType.SESSION_STATUS], SessionStatusData]
-QrCodeUpdatedEvent = BaseWebhookEvent[Literal[WasenderWebhookEventType.QRCODE_UPDATED], QrCodeUpdatedData]
-
-# Discriminated union of all specific event types for parsing
-WasenderWebhookEvent = Union[
-    ChatsUpsertEvent, ChatsUpdateEvent, ChatsDeleteEvent,
-    GroupsUpsertEvent, GroupsUpdateEvent, GroupParticipantsUpdateEvent,
-    ContactsUpsertEvent, ContactsUpdateEvent,
-    MessagesUpsertEvent, MessagesUpdateEvent, MessagesDeleteEvent, MessagesReactionEvent,
-    MessageReceiptUpdateEvent, MessageSentEvent, SessionStatusEvent, QrCodeUpdatedEvent
+# The upsert and update events for chats and contacts carry the same payload shape.
+# Declare the list types once and share one TypeAdapter per shape so standalone
+# validation of these payloads reuses a single compiled validator.
+ChatEntryList = List[ChatEntry]
+ContactEntryList = List[ContactEntry]
+_CHAT_ENTRY_LIST_ADAPTER = TypeAdapter(ChatEntryList)
+_CONTACT_ENTRY_LIST_ADAPTER = TypeAdapter(ContactEntryList)
+
+def parse_chat_entries(payload: Any) -> ChatEntryList:
+    """Validate a bare chats.upsert/chats.update data payload."""
+    return _CHAT_ENTRY_LIST_ADAPTER.validate_python(payload)
+
+def parse_contact_entries(payload: Any) -> ContactEntryList:
+    """Validate a bare contacts.upsert/contacts.update data payload."""
+    return _CONTACT_ENTRY_LIST_ADAPTER.validate_python(payload)
+
+# Define specific event types as plain subclasses that narrow `event` and `data`.
+# Parametrizing the generic base 16 times made pydantic run the generic-alias
+# machinery and build a generic specialization per event type at import; concrete
+# subclasses validate identically without that overhead.
+class ChatsUpsertEvent(BaseWebhookEvent):
+    event: Literal[WasenderWebhookEventType.CHATS_UPSERT]
+    data: ChatEntryList
+
+class ChatsUpdateEvent(BaseWebhookEvent):
+    event: Literal[WasenderWebhookEventType.CHATS_UPDATE]
+    data: ChatEntryList
+
+class ChatsDeleteEvent(BaseWebhookEvent):
+    event: Literal[WasenderWebhookEventType.CHATS_DELETE]
+    data: List[str]
+
+class GroupsUpsertEvent(BaseWebhookEvent):
+    event: Literal[WasenderWebhookEventType.GROUPS_UPSERT]
+    data: List[GroupMetadata]
+
+class GroupsUpdateEvent(BaseWebhookEvent):
+    event: Literal[WasenderWebhookEventType.GROUPS_UPDATE]
+    data: List[GroupMetadata]
+
+class GroupParticipantsUpdateEvent(BaseWebhookEvent):
+    event: Literal[WasenderWebhookEventType.GROUP_PARTICIPANTS_UPDATE]
+    data: GroupParticipantsUpdateData
+
+class ContactsUpsertEvent(BaseWebhookEvent):
+    event: Literal[WasenderWebhookEventType.CONTACTS_UPSERT]
+    data: ContactEntryList
+
+class ContactsUpdateEvent(BaseWebhookEvent):
+    event: Literal[WasenderWebhookEventType.CONTACTS_UPDATE]
+    data: ContactEntryList
+
+class MessagesUpsertEvent(BaseWebhookEvent):
+    event: Literal[WasenderWebhookEventType.MESSAGES_UPSERT]
+    data: MessagesUpsertData
+
+class MessagesUpdateEvent(BaseWebhookEvent):
+    event: Literal[WasenderWebhookEventType.MESSAGES_UPDATE]
+    data: List[MessagesUpdateDataEntry]
+
+class MessagesDeleteEvent(BaseWebhookEvent):
+    event: Literal[WasenderWebhookEventType.MESSAGES_DELETE]
+    data: MessagesDeleteData
+
+class MessagesReactionEvent(BaseWebhookEvent):
+    event: Literal[WasenderWebhookEventType.MESSAGES_REACTION]
+    data: List[MessagesReactionDataEntry]
+
+class MessageReceiptUpdateEvent(BaseWebhookEvent):
+    event: Literal[WasenderWebhookEventType.MESSAGE_RECEIPT_UPDATE]
+    data: List[MessageReceiptUpdateDataEntry]
+
+class MessageSentEvent(BaseWebhookEvent):
+    event: Literal[WasenderWebhookEventType.MESSAGE_SENT]
+    data: MessageSentData
+
+class SessionStatusEvent(BaseWebhookEvent):
+    event: Literal[WasenderWebhookEventType.SESSION_STATUS]
+    data: SessionStatusData
+
+class QrCodeUpdatedEvent(BaseWebhookEvent):
+    event: Literal[WasenderWebhookEventType.QRCODE_UPDATED]
+    data: QrCodeUpdatedData
+
+# Discriminated union of all specific event types for parsing. The discriminator lets
+# pydantic-core dispatch on the `event` field with a single lookup instead of trying
+# each variant in turn.
+WasenderWebhookEvent = Annotated[
+    Union[
+        ChatsUpsertEvent, ChatsUpdateEvent, ChatsDeleteEvent,
+        GroupsUpsertEvent, GroupsUpdateEvent, GroupParticipantsUpdateEvent,
+        ContactsUpsertEvent, ContactsUpdateEvent,
+        MessagesUpsertEvent, MessagesUpdateEvent, MessagesDeleteEvent, MessagesReactionEvent,
+        MessageReceiptUpdateEvent, MessageSentEvent, SessionStatusEvent, QrCodeUpdatedEvent
+    ],
+    Field(discriminator='event')
 ]
 
-# Helper types for partial updates if needed (conceptual)
-class PartialChatEntry(ChatEntry):
-    id: Optional[str] = None
-    name: Optional[str] = None
-    conversation_timestamp: Optional[int] = Field(None, alias="conversationTimestamp")
-    unread_count: Optional[int] = Field(None, alias="unreadCount")
-    mute_end_time: Optional[int] = Field(None, alias="muteEndTime")
-    is_spam: Optional[bool] = Field(None, alias="isSpam")
+# Make sure every event schema is fully built at import: defer_build=False handles
+# the common case, but any schema pydantic left incomplete (e.g. due to forward
+# references) would otherwise be built on the first webhook after startup, showing
+# up as a latency spike on that request.
+for _event_cls in get_args(get_args(WasenderWebhookEvent)[0]):
+    if not _event_cls.__pydantic_complete__:
+        _event_cls.model_rebuild()
+del _event_cls
+
+# Single adapter for the whole union, built once at import so every parse reuses the
+# same compiled validator instead of rebuilding it per call. Touching .validator
+# forces the tagged-union dispatcher to materialize here rather than on first use.
+_WEBHOOK_ADAPTER = TypeAdapter(WasenderWebhookEvent)
+_ = _WEBHOOK_ADAPTER.validator
+del _
+
+def parse_webhook_python(payload: Dict[str, Any]) -> WasenderWebhookEvent:
+    """Parse an already-decoded webhook payload (e.g. a dict) into a typed event."""
+    return _WEBHOOK_ADAPTER.validate_python(payload)
+
+def parse_webhook_json(data: Union[bytes, str]) -> WasenderWebhookEvent:
+    """Parse a raw webhook body into a typed event.
+
+    Pass the body exactly as the HTTP layer delivers it (e.g. ``request.body`` /
+    ``await request.body()``), not the result of ``request.json()``: pydantic-core
+    parses and validates the bytes in a single pass, skipping the intermediate
+    dict that json.loads would build.
+    """
+    return _WEBHOOK_ADAPTER.validate_json(data)
 
-class PartialGroupMetadata(GroupMetadata):
-    jid: Optional[str] = None
-    subject: Optional[str] = None
-    # ... make other fields optional
+def peek_event_type(raw: Union[bytes, str]) -> str:
+    """Read just the `event` field from a raw webhook body, without full validation.
 
-class PartialContactEntry(ContactEntry):
-    jid: Optional[str] = None
-    # ... make other fields optional 
\ No newline at end of file
+    Useful for routing: handlers that only need to shard by event type or reject
+    unknown events can skip the full pydantic parse. Uses jiter (with its string
+    cache) when that optional package is installed, falling back to stdlib json.
+
+    Raises KeyError if the body has no `event` field.
+    """
+    try:
+        import jiter
+    except ImportError:
+        import json
+        if isinstance(raw, bytes):
+            raw = raw.decode('utf-8')
+        return json.loads(raw)['event']
+    if isinstance(raw, str):
+        raw = raw.encode('utf-8')
+    return jiter.from_json(raw, cache_mode='all')['event']
+
+# Helper types for partial updates: the same models with every field optional.
+# Generated from the full models so annotations and aliases are declared once.
+def _partial_model(name: str, base: type) -> type:
+    fields = {
+        field_name: (Optional[f.annotation], Field(None, alias=f.alias))
+        for field_name, f in base.model_fields.items()
+    }
+    return create_model(name, __base__=base, **fields)
+
+PartialChatEntry = _partial_model('PartialChatEntry', ChatEntry)
+PartialGroupMetadata = _partial_model('PartialGroupMetadata', GroupMetadata)
+PartialContactEntry = _partial_model('PartialContactEntry', ContactEntry) 
\ No newline at end of file